@@ -0,0 +1 @@
+"""Configuration package: defaults plus optional YAML overrides."""
@@ -0,0 +1,69 @@
+"""User-tunable settings: built-in defaults plus optional YAML overrides."""
+
+import os
+from functools import lru_cache
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.yaml")
+
+DEFAULT_SETTINGS = {
+    "search": {
+        "timeout": 10,
+        "max_results": 50,
+        "parallel": True,
+    },
+    "export": {
+        "output_dir": "exports",
+        "default_format": "json",
+    },
+    "display": {
+        "max_depth": 4,
+        "max_items": 10,
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _load_settings() -> dict:
+    """Defaults merged with the YAML override file, when present.
+
+    Cached so repeated ``get_setting`` calls (every plugin constructor,
+    every test) parse the YAML file once per process; ``set_setting``
+    and :func:`reload_settings` invalidate.
+    """
+    settings = {section: dict(values)
+                for section, values in DEFAULT_SETTINGS.items()}
+    if YAML_AVAILABLE and os.path.isfile(SETTINGS_FILE):
+        with open(SETTINGS_FILE, encoding="utf-8") as handle:
+            overrides = yaml.safe_load(handle) or {}
+        for section, values in overrides.items():
+            settings.setdefault(section, {}).update(values or {})
+    return settings
+
+
+def get_setting(section: str, key: str, default=None):
+    """Look up one settings value, falling back to ``default``."""
+    return _load_settings().get(section, {}).get(key, default)
+
+
+def set_setting(section: str, key: str, value) -> None:
+    """Persist one settings value to the YAML override file."""
+    if not YAML_AVAILABLE:
+        raise RuntimeError("PyYAML is required to persist settings")
+    # Copy before mutating: _load_settings() returns the cached dict.
+    settings = {name: dict(values)
+                for name, values in _load_settings().items()}
+    settings.setdefault(section, {})[key] = value
+    with open(SETTINGS_FILE, "w", encoding="utf-8") as handle:
+        yaml.safe_dump(settings, handle, default_flow_style=False)
+    _load_settings.cache_clear()
+
+
+def reload_settings() -> None:
+    """Drop the cached settings; the next lookup re-reads the YAML file."""
+    _load_settings.cache_clear()
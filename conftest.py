@@ -0,0 +1,48 @@
+"""Shared pytest fixtures for the framework and plugin suites."""
+
+import os
+
+import pytest
+
+from core.engine import OSINTEngine
+from plugins import discover_plugins
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests when OFFLINE is set; they all hit the network."""
+    if not os.environ.get("OFFLINE"):
+        return
+    skip = pytest.mark.skip(reason="offline (OFFLINE env var set)")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def vcr_config():
+    """pytest-recording settings shared by every cassette-backed test.
+
+    record_mode=once writes the cassette on the first live run and
+    replays it afterwards, so default test runs stay off the network;
+    CI passes --record-mode=none to forbid new recordings. Credential
+    headers never reach the YAML files.
+    """
+    return {
+        "filter_headers": ["authorization", "hibp-api-key"],
+        "record_mode": "once",
+    }
+
+
+@pytest.fixture(scope="session")
+def discovered_plugins():
+    """One plugin scan per test session; discovery is import-bound."""
+    return discover_plugins()
+
+
+@pytest.fixture(scope="session")
+def engine(discovered_plugins):
+    """An engine with every discovered plugin registered."""
+    osint_engine = OSINTEngine()
+    for plugin in discovered_plugins:
+        osint_engine.register_plugin(plugin)
+    return osint_engine
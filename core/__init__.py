@@ -0,0 +1 @@
+"""Core framework: plugin contracts, engine, result handling and export."""
@@ -0,0 +1,119 @@
+"""Search engine: plugin registry and fan-out across registered plugins."""
+
+import logging
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+from core.result_handler import ResultAggregator
+
+
+class OSINTEngine:
+    """Owns the plugin registry and runs searches against it."""
+
+    def __init__(self):
+        self.plugins: dict[str, BasePlugin] = {}
+        self.results: list[PluginResult] = []
+        self.result_aggregator = ResultAggregator()
+        self.logger = logging.getLogger("engine")
+
+    def register_plugin(self, plugin: BasePlugin) -> None:
+        if plugin.name in self.plugins:
+            self.logger.warning("Replacing already-registered plugin %s",
+                                plugin.name)
+        self.plugins[plugin.name] = plugin
+
+    def get_all_plugins(self) -> list[BasePlugin]:
+        return list(self.plugins.values())
+
+    def get_enabled_plugins(self) -> list[BasePlugin]:
+        return [p for p in self.plugins.values() if p.enabled]
+
+    def run_single_plugin(self, plugin_name: str, query: str,
+                          search_type: SearchType, aggregate: bool = True,
+                          **kwargs) -> PluginResult | None:
+        """Run one plugin by name; None when it is unknown or disabled.
+
+        Aggregation happens here rather than at every call site, so UI
+        code can't forget the start/end bookkeeping; pass
+        ``aggregate=False`` when the caller batches results itself.
+        """
+        plugin = self.plugins.get(plugin_name)
+        if plugin is None:
+            self.logger.warning("No such plugin: %s", plugin_name)
+            return None
+        if not plugin.enabled:
+            self.logger.info("Plugin %s is disabled", plugin_name)
+            return None
+        if aggregate:
+            self.result_aggregator.start_search(1)
+        result = plugin.run(query, search_type, **kwargs)
+        self.results.append(result)
+        if aggregate:
+            self.result_aggregator.add_result(result)
+            self.result_aggregator.end_search()
+        return result
+
+    def iter_run_all_plugins(self, query: str, search_type: SearchType,
+                             **kwargs) -> Iterator[PluginResult]:
+        """Yield results from matching plugins as each one completes.
+
+        Completion order, not registration order: callers that render
+        incrementally get the fastest plugin's result while the slowest
+        is still on the wire.
+        """
+        targets = [p for p in self.get_enabled_plugins()
+                   if p.supports(search_type)]
+        if not targets:
+            return
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = [executor.submit(p.run, query, search_type, **kwargs)
+                       for p in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                self.results.append(result)
+                yield result
+
+    async def run_all_plugins_async(self, query: str, search_type: SearchType,
+                                    **kwargs) -> list[PluginResult]:
+        """Async fan-out across matching plugins.
+
+        Plugins are synchronous, so each runs on a worker thread via
+        ``asyncio.to_thread``; the event loop stays free between await
+        points for callers that render while waiting.
+        """
+        import asyncio
+
+        targets = [p for p in self.get_enabled_plugins()
+                   if p.supports(search_type)]
+        if not targets:
+            return []
+        results = await asyncio.gather(
+            *(asyncio.to_thread(p.run, query, search_type, **kwargs)
+              for p in targets))
+        self.results.extend(results)
+        return list(results)
+
+    def run_all_plugins(self, query: str, search_type: SearchType,
+                        parallel: bool = True,
+                        **kwargs) -> list[PluginResult]:
+        """Run every enabled plugin that supports ``search_type``.
+
+        Plugin searches are independent network waits, so the default is
+        a thread-pool fan-out; ``parallel=False`` keeps the serial path
+        for debugging.
+        """
+        if parallel:
+            return list(self.iter_run_all_plugins(query, search_type,
+                                                  **kwargs))
+        targets = [p for p in self.get_enabled_plugins()
+                   if p.supports(search_type)]
+        results = [p.run(query, search_type, **kwargs) for p in targets]
+        self.results.extend(results)
+        return results
+
+    def get_results(self) -> list[PluginResult]:
+        return list(self.results)
+
+    def clear_results(self) -> None:
+        self.results.clear()
@@ -0,0 +1,163 @@
+"""Export aggregated results to JSON, HTML, CSV and SQLite."""
+
+import csv
+import html
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+from core.plugin_base import PluginResult
+
+
+def _result_to_dict(result: PluginResult) -> dict:
+    return {
+        "plugin_name": result.plugin_name,
+        "query": result.query,
+        "search_type": result.search_type.value,
+        "success": result.success,
+        "data": result.data,
+        "error_message": result.error_message,
+        "timestamp": result.timestamp.isoformat(),
+        "execution_time": result.execution_time,
+    }
+
+
+def _flatten_rows(results: list[PluginResult]) -> list[dict]:
+    """Results as plain dicts; computed once and shared by every writer."""
+    return [_result_to_dict(result) for result in results]
+
+
+class Exporter:
+    """Writes a batch of results to one file per requested format.
+
+    Each ``export_*`` method also accepts an in-memory sink (a text
+    stream, or an open connection for SQLite) so callers like the test
+    suite can skip disk I/O entirely; ``"<sink>"`` is returned in place
+    of a path in that case. A pre-flattened ``rows`` list may be passed
+    so multi-format exports walk the results only once.
+    """
+
+    def __init__(self, output_dir: str = "exports"):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _output_path(self, query: str, extension: str) -> Path:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_query = "".join(c if c.isalnum() else "_" for c in query)[:40]
+        return self.output_dir / f"osint_{safe_query}_{stamp}.{extension}"
+
+    def export_json(self, results: list[PluginResult], query: str = "",
+                    sink: IO[str] | None = None,
+                    rows: list[dict] | None = None) -> str:
+        rows = _flatten_rows(results) if rows is None else rows
+        if sink is not None:
+            json.dump(rows, sink, indent=2)
+            return "<sink>"
+        path = self._output_path(query, "json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(rows, handle, indent=2)
+        return str(path)
+
+    def export_html(self, results: list[PluginResult], query: str = "",
+                    sink: IO[str] | None = None,
+                    rows: list[dict] | None = None) -> str:
+        rows = _flatten_rows(results) if rows is None else rows
+        cells = []
+        for row in rows:
+            status = "ok" if row["success"] else "failed"
+            cells.append(
+                f"<tr><td>{html.escape(row['plugin_name'])}</td>"
+                f"<td>{html.escape(row['query'])}</td>"
+                f"<td>{row['search_type']}</td>"
+                f"<td>{status}</td>"
+                f"<td>{row['execution_time']:.2f}s</td></tr>")
+        document = (
+            "<!DOCTYPE html><html><head><title>OSINT results</title></head>"
+            "<body><h1>OSINT results</h1><table border='1'>"
+            "<tr><th>Plugin</th><th>Query</th><th>Type</th>"
+            "<th>Status</th><th>Time</th></tr>"
+            + "".join(cells) + "</table></body></html>")
+        if sink is not None:
+            sink.write(document)
+            return "<sink>"
+        path = self._output_path(query, "html")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(document)
+        return str(path)
+
+    def export_csv(self, results: list[PluginResult], query: str = "",
+                   sink: IO[str] | None = None,
+                   rows: list[dict] | None = None) -> str:
+        rows = _flatten_rows(results) if rows is None else rows
+        if sink is not None:
+            self._write_csv(sink, rows)
+            return "<sink>"
+        path = self._output_path(query, "csv")
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            self._write_csv(handle, rows)
+        return str(path)
+
+    @staticmethod
+    def _write_csv(handle: IO[str], rows: list[dict]) -> None:
+        writer = csv.writer(handle)
+        writer.writerow(["plugin_name", "query", "search_type", "success",
+                         "error_message", "timestamp", "execution_time"])
+        for row in rows:
+            writer.writerow([row["plugin_name"], row["query"],
+                             row["search_type"], row["success"],
+                             row["error_message"] or "",
+                             row["timestamp"], row["execution_time"]])
+
+    def export_sqlite(self, results: list[PluginResult], query: str = "",
+                      connection: sqlite3.Connection | None = None,
+                      rows: list[dict] | None = None) -> str:
+        rows = _flatten_rows(results) if rows is None else rows
+        if connection is not None:
+            # Caller-supplied connection (e.g. :memory:) stays open.
+            self._write_sqlite(connection, rows)
+            return "<sink>"
+        path = self._output_path(query, "db")
+        connection = sqlite3.connect(path)
+        try:
+            self._write_sqlite(connection, rows)
+        finally:
+            connection.close()
+        return str(path)
+
+    @staticmethod
+    def _write_sqlite(connection: sqlite3.Connection,
+                      rows: list[dict]) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "plugin_name TEXT, query TEXT, search_type TEXT,"
+            "success INTEGER, data TEXT, error_message TEXT,"
+            "timestamp TEXT, execution_time REAL)")
+        connection.executemany(
+            "INSERT INTO results (plugin_name, query, search_type,"
+            " success, data, error_message, timestamp, execution_time)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(row["plugin_name"], row["query"], row["search_type"],
+              int(row["success"]), json.dumps(row["data"]),
+              row["error_message"], row["timestamp"],
+              row["execution_time"])
+             for row in rows])
+        connection.commit()
+
+    def export_all(self, results: list[PluginResult],
+                   query: str = "") -> dict[str, str]:
+        """Write every supported format and return format -> path.
+
+        The results are flattened once and the four writers run on a
+        small thread pool; they only contend on disk bandwidth.
+        """
+        rows = _flatten_rows(results)
+        formats = ("json", "html", "csv", "sqlite")
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {fmt: executor.submit(
+                getattr(self, f"export_{fmt}"), results, query, rows=rows)
+                for fmt in formats}
+            return {fmt: future.result() for fmt, future in futures.items()}
@@ -0,0 +1,115 @@
+"""Base classes and result types shared by every OSINT plugin."""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import Enum
+
+
+class SearchType(Enum):
+    """Kinds of queries a plugin can handle."""
+
+    EMAIL = "email"
+    USERNAME = "username"
+    DOMAIN = "domain"
+    IP = "ip"
+    URL = "url"
+    PHONE = "phone"
+    PASSWORD = "password"
+    NETWORK = "network"
+
+
+@dataclass(slots=True, frozen=True)
+class PluginResult:
+    """Outcome of a single plugin search.
+
+    Declared with ``slots=True`` because a crawl can produce one instance
+    per page and the per-instance ``__dict__`` would otherwise dominate
+    memory on large sweeps; frozen so results can be shared across the
+    aggregator and display threads without defensive copies.
+    """
+
+    plugin_name: str
+    query: str
+    search_type: SearchType
+    success: bool
+    data: dict = field(default_factory=dict)
+    error_message: str | None = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    execution_time: float = 0.0
+
+
+class BasePlugin(ABC):
+    """Common behaviour for OSINT plugins.
+
+    Subclasses override the ``name``, ``description`` and ``search_types``
+    class attributes and implement :meth:`search`.
+    """
+
+    name: str = "base"
+    description: str = ""
+    search_types: tuple[SearchType, ...] = ()
+
+    def __init__(self):
+        self.enabled = True
+        self.logger = logging.getLogger(f"plugin.{self.name}")
+        # name and description are immutable, so the choice label is
+        # formatted once here instead of per menu render.
+        self._choice_label = f"{self.name} — {self.description}"
+
+    @property
+    def display_label(self) -> str:
+        """Menu label; only the enabled suffix is formatted per access."""
+        suffix = "" if self.enabled else " [disabled]"
+        return f"{self._choice_label}{suffix}"
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def supports(self, search_type: SearchType) -> bool:
+        """Return True if this plugin can handle ``search_type``."""
+        return search_type in self.search_types
+
+    @abstractmethod
+    def search(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        """Run a search and return a :class:`PluginResult`."""
+
+    def run(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        """Wrapper around :meth:`search` that times the call and catches errors."""
+        start = time.monotonic()
+        try:
+            result = self.search(query, search_type, **kwargs)
+        except Exception as exc:  # noqa: BLE001 - plugins must never kill the engine
+            self.log_error(f"search failed: {exc}")
+            return self.error_result(query, search_type, str(exc),
+                                     execution_time=time.monotonic() - start)
+        if not result.execution_time:
+            result = replace(result, execution_time=time.monotonic() - start)
+        return result
+
+    def success_result(self, query: str, search_type: SearchType, data: dict,
+                       execution_time: float = 0.0) -> PluginResult:
+        return PluginResult(plugin_name=self.name, query=query,
+                            search_type=search_type, success=True, data=data,
+                            execution_time=execution_time)
+
+    def error_result(self, query: str, search_type: SearchType, message: str,
+                     execution_time: float = 0.0) -> PluginResult:
+        return PluginResult(plugin_name=self.name, query=query,
+                            search_type=search_type, success=False,
+                            error_message=message,
+                            execution_time=execution_time)
+
+    def log_info(self, message: str) -> None:
+        self.logger.info(message)
+
+    def log_warning(self, message: str) -> None:
+        self.logger.warning(message)
+
+    def log_error(self, message: str) -> None:
+        self.logger.error(message)
@@ -0,0 +1,56 @@
+"""Aggregation of plugin results across a search session."""
+
+import threading
+
+from core.plugin_base import PluginResult
+
+
+class ResultAggregator:
+    """Collects results from many plugins and summarizes a search run.
+
+    All mutating methods take the internal lock so the engine can feed
+    results in from worker threads.
+    """
+
+    def __init__(self):
+        self._results: list[PluginResult] = []
+        self._lock = threading.Lock()
+        self._expected = 0
+        self._searches_run = 0
+
+    def start_search(self, expected_plugins: int) -> None:
+        """Mark the beginning of a search fanned out to N plugins."""
+        with self._lock:
+            self._expected = expected_plugins
+
+    def add_result(self, result: PluginResult) -> None:
+        with self._lock:
+            self._results.append(result)
+
+    def end_search(self) -> None:
+        """Mark the end of the current search."""
+        with self._lock:
+            self._searches_run += 1
+            self._expected = 0
+
+    def get_results(self) -> list[PluginResult]:
+        with self._lock:
+            return list(self._results)
+
+    def get_summary(self) -> dict:
+        with self._lock:
+            successes = sum(1 for r in self._results if r.success)
+            return {
+                "total_results": len(self._results),
+                "successful": successes,
+                "failed": len(self._results) - successes,
+                "searches_run": self._searches_run,
+                "total_execution_time": sum(r.execution_time
+                                            for r in self._results),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._searches_run = 0
+            self._expected = 0
@@ -0,0 +1,11 @@
+"""Entry point: launch the interactive OSINT toolkit menu."""
+
+from ui.menu import MenuSystem
+
+
+def main() -> None:
+    MenuSystem().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Plugin package: one module per OSINT source.
+
+``discover_plugins`` scans this package, imports every module and
+instantiates each :class:`~core.plugin_base.BasePlugin` subclass it finds.
+Modules whose third-party dependencies are missing are skipped with a
+warning rather than breaking discovery for everyone else.
+"""
+
+import importlib
+import inspect
+import logging
+import pkgutil
+from functools import lru_cache
+
+from core.plugin_base import BasePlugin
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _scan() -> tuple[BasePlugin, ...]:
+    """Scan the package once per process; discovery is import-bound."""
+    plugins: list[BasePlugin] = []
+    for module_info in pkgutil.iter_modules(__path__):
+        try:
+            module = importlib.import_module(f"{__name__}.{module_info.name}")
+        except ImportError as exc:
+            logger.warning("Skipping plugin module %s: %s", module_info.name, exc)
+            continue
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if (issubclass(obj, BasePlugin) and obj is not BasePlugin
+                    and obj.__module__ == module.__name__):
+                plugins.append(obj())
+    return tuple(plugins)
+
+
+def discover_plugins() -> list[BasePlugin]:
+    """Return plugin instances, scanning the package on first call only.
+
+    Callers get a fresh list (the cached tuple stays unaliased) but the
+    plugin instances themselves are shared for the life of the process.
+    """
+    return list(_scan())
@@ -0,0 +1,85 @@
+"""Have I Been Pwned plugin: breached accounts and pwned passwords."""
+
+import hashlib
+from functools import lru_cache
+
+import requests
+
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+
+API_BASE = "https://haveibeenpwned.com/api/v3"
+PASSWORD_API = "https://api.pwnedpasswords.com/range"
+USER_AGENT = "osint-toolkit/1.0"
+
+
+@lru_cache(maxsize=10_000)
+def _fetch_range(prefix: str, timeout: int = 10) -> str:
+    """Fetch one k-anonymity range; identical prefixes reuse the body."""
+    response = requests.get(f"{PASSWORD_API}/{prefix}",
+                            headers={"User-Agent": USER_AGENT},
+                            timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+class HIBPPlugin(BasePlugin):
+    """Checks emails against known breaches and passwords via k-anonymity."""
+
+    name = "hibp"
+    description = "Breach and pwned-password lookups via Have I Been Pwned"
+    search_types = (SearchType.EMAIL, SearchType.PASSWORD)
+
+    def search(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        timeout = kwargs.get("timeout", 10)
+        if search_type == SearchType.PASSWORD:
+            try:
+                count = self.check_password(query, timeout=timeout)
+            except requests.RequestException as exc:
+                return self.error_result(query, search_type,
+                                         f"HIBP request failed: {exc}")
+            return self.success_result("<password>", search_type, {
+                "pwned": count > 0,
+                "times_seen": count,
+            })
+        return self._search_breaches(query, kwargs.get("api_key"), timeout)
+
+    def check_password(self, password: str, timeout: int = 10) -> int:
+        """How often a password appears in known breaches.
+
+        Only the first five hex characters of the SHA-1 ever leave the
+        machine (k-anonymity); the returned range is scanned locally.
+        """
+        digest = hashlib.sha1(password.encode()).hexdigest().upper()
+        prefix, suffix = digest[:5], digest[5:]
+        for line in _fetch_range(prefix, timeout=timeout).splitlines():
+            hash_suffix, _, count = line.partition(":")
+            if hash_suffix == suffix:
+                return int(count)
+        return 0
+
+    def _search_breaches(self, email: str, api_key: str | None,
+                         timeout: int) -> PluginResult:
+        if not api_key:
+            return self.error_result(email, SearchType.EMAIL,
+                                     "HIBP API key required (pass api_key=...)")
+        try:
+            response = requests.get(
+                f"{API_BASE}/breachedaccount/{email}",
+                headers={"hibp-api-key": api_key, "User-Agent": USER_AGENT},
+                params={"truncateResponse": "false"},
+                timeout=timeout)
+        except requests.RequestException as exc:
+            return self.error_result(email, SearchType.EMAIL,
+                                     f"HIBP request failed: {exc}")
+        if response.status_code == 404:
+            return self.success_result(email, SearchType.EMAIL,
+                                       {"breached": False, "breaches": []})
+        if response.status_code != 200:
+            return self.error_result(email, SearchType.EMAIL,
+                                     f"HIBP returned {response.status_code}")
+        breaches = response.json()
+        return self.success_result(email, SearchType.EMAIL, {
+            "breached": True,
+            "breaches": [{"name": b.get("Name"), "domain": b.get("Domain"),
+                          "date": b.get("BreachDate")} for b in breaches],
+        })
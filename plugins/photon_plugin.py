@@ -0,0 +1,121 @@
+"""Photon-style website crawler plugin: pages, links, emails, phone numbers."""
+
+import functools
+import re
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+PHONE_RE = re.compile(r"\+?\d[\d\s().-]{6,14}\d")
+ENDPOINT_RE = re.compile(r"""["'](/[A-Za-z0-9_./-]{1,128})["']""")
+
+USER_AGENT = "Mozilla/5.0 (compatible; osint-toolkit/1.0)"
+SKIP_SCHEMES = ("#", "javascript:", "mailto:", "tel:")
+
+# urlparse/urldefrag are pure Python and run once per anchor; hub pages
+# repeat the same URLs constantly, so a small LRU pays for itself fast.
+_cached_urlparse = functools.lru_cache(maxsize=4096)(urlparse)
+_cached_urldefrag = functools.lru_cache(maxsize=4096)(urldefrag)
+
+
+class PhotonPlugin(BasePlugin):
+    """Crawls a site breadth-first and harvests links, emails and phones."""
+
+    name = "photon"
+    description = "Website crawler extracting links, emails and phone numbers"
+    search_types = (SearchType.URL, SearchType.DOMAIN)
+
+    def search(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        url = self._normalize_url(query)
+        max_pages = kwargs.get("max_pages", 25)
+        timeout = kwargs.get("timeout", 10)
+
+        # attempted dedupes fetches; crawled holds only pages that were
+        # actually retrieved, so failed URLs never inflate the report.
+        attempted: set[str] = set()
+        crawled: set[str] = set()
+        to_visit = [url]
+        emails: set[str] = set()
+        phones: set[str] = set()
+        endpoints: set[str] = set()
+
+        while to_visit and len(crawled) < max_pages:
+            current = to_visit.pop(0)
+            if current in attempted:
+                continue
+            attempted.add(current)
+            try:
+                response = requests.get(current, timeout=timeout,
+                                        headers={"User-Agent": USER_AGENT})
+                response.raise_for_status()
+            except requests.RequestException as exc:
+                self.log_warning(f"fetch failed for {current}: {exc}")
+                continue
+            crawled.add(current)
+
+            # Feed raw bytes to lxml: it sniffs <meta charset> itself in C,
+            # while response.text would run chardet over the whole body.
+            soup = BeautifulSoup(response.content, "lxml")
+            # One DOM walk shared by both text extractors.
+            page_text = soup.get_text(separator=" ")
+            self._extract_emails(page_text, emails)
+            self._extract_phone_numbers(page_text, phones)
+            self._extract_endpoints(response.content, endpoints)
+            for link in self._extract_links(soup, current, attempted):
+                to_visit.append(link)
+
+        if not crawled:
+            return self.error_result(query, search_type,
+                                     f"Could not fetch any page from {url}")
+        data = {
+            "start_url": url,
+            "pages_crawled": len(crawled),
+            "urls": sorted(crawled),
+            "emails": sorted(emails),
+            "phone_numbers": sorted(phones),
+            "endpoints": sorted(endpoints),
+        }
+        return self.success_result(query, search_type, data)
+
+    def _normalize_url(self, query: str) -> str:
+        """Ensure the query has a scheme so urllib treats it as absolute."""
+        if not query.startswith(("http://", "https://")):
+            return f"https://{query}"
+        return query
+
+    def _extract_links(self, soup, base_url: str,
+                       attempted: set[str]) -> list[str]:
+        """Collect same-domain links, deduplicated as they are found.
+
+        Filtering through a ``seen`` set while appending keeps output order
+        stable and avoids materializing every duplicate href on link-heavy
+        pages only to throw most of them away afterwards.
+        """
+        base_domain = _cached_urlparse(base_url).netloc
+        seen: set[str] = set()
+        out: list[str] = []
+        for anchor in soup.find_all("a", href=True):
+            href = anchor["href"].strip()
+            if not href or href.startswith(SKIP_SCHEMES):
+                continue
+            full_url = _cached_urldefrag(urljoin(base_url, href)).url
+            parsed = _cached_urlparse(full_url)
+            if (parsed.netloc == base_domain and full_url not in attempted
+                    and full_url not in seen):
+                seen.add(full_url)
+                out.append(full_url)
+        return out
+
+    def _extract_emails(self, page_text: str, emails: set[str]) -> None:
+        emails.update(EMAIL_RE.findall(page_text))
+
+    def _extract_phone_numbers(self, page_text: str, phones: set[str]) -> None:
+        for match in PHONE_RE.findall(page_text):
+            phones.add(re.sub(r"[\s().-]", "", match))
+
+    def _extract_endpoints(self, content: bytes, endpoints: set[str]) -> None:
+        endpoints.update(ENDPOINT_RE.findall(content.decode("utf-8", "ignore")))
@@ -0,0 +1,211 @@
+"""Sherlock-style username enumeration plugin.
+
+Prefers the installed ``sherlock`` CLI for its full site list; when it is
+missing, falls back to a built-in async checker covering a smaller set of
+well-known sites.
+"""
+
+import asyncio
+import importlib.util
+import json
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from sherlock_project.async_engine import sherlock_async
+    SHERLOCK_API_AVAILABLE = True
+except ImportError:
+    sherlock_async = None
+    SHERLOCK_API_AVAILABLE = False
+
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+
+# Subset of sherlock's data.json: url template plus the error convention
+# used to tell a profile page from a soft 404 ("status" or "message").
+BUILTIN_SITES = {
+    "GitHub": {"url": "https://github.com/{username}", "errorType": "status_code"},
+    "GitLab": {"url": "https://gitlab.com/{username}", "errorType": "status_code"},
+    "Reddit": {"url": "https://www.reddit.com/user/{username}", "errorType": "status_code"},
+    "Twitter": {"url": "https://twitter.com/{username}", "errorType": "status_code"},
+    "Instagram": {"url": "https://www.instagram.com/{username}", "errorType": "status_code"},
+    "Twitch": {"url": "https://www.twitch.tv/{username}", "errorType": "message",
+               "errorMsg": "Sorry. Unless you've got a time machine"},
+    "Pinterest": {"url": "https://www.pinterest.com/{username}/", "errorType": "status_code"},
+    "Medium": {"url": "https://medium.com/@{username}", "errorType": "status_code"},
+    "Keybase": {"url": "https://keybase.io/{username}", "errorType": "status_code"},
+    "HackerNews": {"url": "https://news.ycombinator.com/user?id={username}",
+                   "errorType": "message", "errorMsg": "No such user"},
+    "PyPI": {"url": "https://pypi.org/user/{username}/", "errorType": "status_code"},
+    "Docker Hub": {"url": "https://hub.docker.com/u/{username}/", "errorType": "status_code"},
+}
+
+MAX_CONCURRENCY = 50
+
+
+class SherlockPlugin(BasePlugin):
+    """Checks whether a username exists on a catalogue of sites."""
+
+    name = "sherlock"
+    description = "Username enumeration across social networks and dev sites"
+    search_types = (SearchType.USERNAME,)
+
+    # Class-level caches: the site list, install probe and CLI capability
+    # probe are identical for every instance and every query in a process.
+    _site_data = None
+    _installed: bool | None = None
+    _cli_workers_flag: bool | None = None
+
+    def __init__(self):
+        super().__init__()
+        self._sherlock_available = self._check_sherlock_installed()
+
+    @classmethod
+    def _check_sherlock_installed(cls) -> bool:
+        """Cheap install probe: a spec lookup plus a PATH scan.
+
+        The old subprocess `sherlock --version` probe forked a whole
+        interpreter (~100-300 ms) on every plugin instantiation.
+        """
+        if cls._installed is None:
+            cls._installed = (
+                importlib.util.find_spec("sherlock_project") is not None
+                or shutil.which("sherlock") is not None)
+        return cls._installed
+
+    def search(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        timeout = kwargs.get("timeout", 10)
+        if SHERLOCK_API_AVAILABLE:
+            return self._search_api(query, search_type, timeout)
+        if self._sherlock_available:
+            return self.run_search(query, search_type, timeout)
+        return self._search_builtin(query, search_type, timeout)
+
+    def _search_api(self, query: str, search_type: SearchType,
+                    timeout: int) -> PluginResult:
+        """Drive sherlock's in-process async engine, skipping the subprocess
+        spawn and temp-file JSON round-trip entirely."""
+        try:
+            results = asyncio.run(sherlock_async(query, self._load_site_data(),
+                                                 timeout=timeout, workers=100))
+        except Exception as exc:  # noqa: BLE001 - fall back to the CLI path
+            self.log_warning(f"sherlock async engine failed: {exc}")
+            if self._sherlock_available:
+                return self.run_search(query, search_type, timeout)
+            return self._search_builtin(query, search_type, timeout)
+        found = {name: info.get("url_user", "")
+                 for name, info in results.items()
+                 if info.get("status") == "Claimed"}
+        return self.success_result(query, search_type, {
+            "username": query,
+            "found": found,
+            "sites_found": len(found),
+            "source": "sherlock-api",
+        })
+
+    @classmethod
+    def _load_site_data(cls):
+        """Parse sherlock's data.json once per process, not per query."""
+        if cls._site_data is None:
+            from sherlock_project.sites import SitesInformation
+            cls._site_data = SitesInformation()
+        return cls._site_data
+
+    @classmethod
+    def _cli_supports_workers(cls) -> bool:
+        if cls._cli_workers_flag is None:
+            try:
+                probe = subprocess.run(["sherlock", "--help"],
+                                       capture_output=True, timeout=5)
+                cls._cli_workers_flag = b"--workers" in probe.stdout
+            except (OSError, subprocess.TimeoutExpired):
+                cls._cli_workers_flag = False
+        return cls._cli_workers_flag
+
+    def run_search(self, query: str, search_type: SearchType,
+                   timeout: int) -> PluginResult:
+        """Shell out to the sherlock CLI and parse its JSON output."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / f"{query}.json"
+            command = ["sherlock", query, "--timeout", str(timeout),
+                       "--output", str(output), "--print-found"]
+            if self._cli_supports_workers():
+                command += ["--workers", "100"]
+            try:
+                subprocess.run(command, capture_output=True,
+                               timeout=max(120, timeout * 30))
+            except (OSError, subprocess.TimeoutExpired) as exc:
+                return self.error_result(query, search_type,
+                                         f"sherlock invocation failed: {exc}")
+            try:
+                found = json.loads(output.read_text())
+            except (OSError, json.JSONDecodeError):
+                found = {}
+        return self.success_result(query, search_type, {
+            "username": query,
+            "found": found,
+            "sites_found": len(found),
+            "source": "sherlock",
+        })
+
+    def _search_builtin(self, query: str, search_type: SearchType,
+                        timeout: int) -> PluginResult:
+        """Probe the built-in site list concurrently with HEAD requests."""
+        if not AIOHTTP_AVAILABLE:
+            return self.error_result(
+                query, search_type,
+                "neither the sherlock CLI nor aiohttp is available")
+        found = asyncio.run(self._check_sites(query, timeout))
+        return self.success_result(query, search_type, {
+            "username": query,
+            "found": found,
+            "sites_found": len(found),
+            "sites_checked": len(BUILTIN_SITES),
+            "source": "builtin",
+        })
+
+    async def _check_sites(self, username: str, timeout: int) -> dict[str, str]:
+        """Fan out one coroutine per site, bounded by a semaphore.
+
+        HEAD is tried first and only downgraded to GET when a site rejects
+        it (405) or the found/not-found call needs the body text.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(connector=connector,
+                                         timeout=client_timeout) as session:
+            tasks = [self._check_site(session, sem, name, info, username)
+                     for name, info in BUILTIN_SITES.items()]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        return {name: url for hit in results
+                if not isinstance(hit, BaseException) and hit
+                for name, url in (hit,)}
+
+    async def _check_site(self, session, sem, name: str, info: dict,
+                          username: str) -> tuple[str, str] | None:
+        url = info["url"].replace("{username}", username)
+        async with sem:
+            try:
+                async with session.head(url, allow_redirects=False) as resp:
+                    status = resp.status
+                if status == 405 or info["errorType"] == "message":
+                    async with session.get(url, allow_redirects=False) as resp:
+                        status = resp.status
+                        body = await resp.text()
+                    if info["errorType"] == "message":
+                        if status == 200 and info["errorMsg"] not in body:
+                            return name, url
+                        return None
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return None
+        if status == 200:
+            return name, url
+        return None
@@ -0,0 +1,381 @@
+"""Whois and DNS reconnaissance plugin: registration data, records, PTRs."""
+
+import asyncio
+import importlib.util
+import ipaddress
+import re
+import socket
+from functools import lru_cache
+
+from cachetools import TTLCache
+
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+
+
+# dnspython pulls in dns.rdtypes.* (tens of ms and a few hundred KB per
+# process) and python-whois is similar, so neither is imported at module
+# level: plugin discovery stays cheap and searches that never touch
+# DNS/whois never pay for them.  sys.modules makes repeat function-scope
+# imports free.
+@lru_cache(maxsize=None)
+def _dns_available() -> bool:
+    return importlib.util.find_spec("dns") is not None
+
+
+@lru_cache(maxsize=None)
+def _whois_available() -> bool:
+    return importlib.util.find_spec("whois") is not None
+
+RECORD_TYPES = ("A", "MX", "NS", "TXT", "CNAME", "AAAA")
+
+WHOIS_FIELD_RE = re.compile(
+    r"^\s*(domain name|registrar|creation date|created|expiration date"
+    r"|registry expiry date|expiry date|name server|nserver"
+    r"|domain status|status)\s*:\s*(.+?)\s*$",
+    re.IGNORECASE | re.MULTILINE)
+_WHOIS_FIELDS = {
+    "domain name": "domain_name",
+    "registrar": "registrar",
+    "creation date": "creation_date",
+    "created": "creation_date",
+    "expiration date": "expiration_date",
+    "registry expiry date": "expiration_date",
+    "expiry date": "expiration_date",
+    "name server": "name_servers",
+    "nserver": "name_servers",
+    "domain status": "status",
+    "status": "status",
+}
+
+IANA_WHOIS = "whois.iana.org"
+WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.publicinterestregistry.org",
+    "info": "whois.afilias.net",
+    "io": "whois.nic.io",
+    "dev": "whois.nic.google",
+    "app": "whois.nic.google",
+    "edu": "whois.educause.edu",
+    "uk": "whois.nic.uk",
+    "de": "whois.denic.de",
+    "fr": "whois.nic.fr",
+    "nl": "whois.domain-registry.nl",
+}
+
+
+class WhoisPlugin(BasePlugin):
+    """Registration and DNS posture lookups for domains and IPs."""
+
+    name = "whois"
+    description = "Whois registration data and DNS record enumeration"
+    search_types = (SearchType.DOMAIN, SearchType.IP)
+
+    def __init__(self):
+        super().__init__()
+        # Bounded TTL caches: one _search_domain call alone re-queries the
+        # same domain several times (records, DNSKEY, A/AAAA) and batch
+        # scans repeat targets, so a hit saves a full network round-trip.
+        self._dns_cache = TTLCache(maxsize=4096, ttl=300)
+        self._whois_cache = TTLCache(maxsize=1024, ttl=3600)
+        # Shared resolvers, built lazily on first DNS use: a fresh
+        # Resolver() re-reads /etc/resolv.conf per call and starts with
+        # an empty cache, so the queries inside one scan shared nothing.
+        self._resolver = None
+        self._async_resolver = None
+
+    def search(self, query: str, search_type: SearchType, **kwargs) -> PluginResult:
+        if search_type == SearchType.IP:
+            return self._search_ip(query, search_type, **kwargs)
+        return self._search_domain(query, search_type, **kwargs)
+
+    def _search_domain(self, domain: str, search_type: SearchType,
+                       **kwargs) -> PluginResult:
+        if not _dns_available():
+            return self.error_result(domain, search_type,
+                                     "dnspython is not installed")
+        dns_servers = kwargs.get("dns_servers")
+        record_types = kwargs.get("record_types", RECORD_TYPES)
+
+        # All the record-type queries, the DNSKEY probe, the A/AAAA
+        # resolution and the PTR lookups are independent UDP round-trips;
+        # firing them through one gather turns sum-of-latencies into
+        # max-of-latencies.
+        dns_records, dnssec_enabled, ip_addresses, reverse_dns = asyncio.run(
+            self._gather_domain(domain, record_types, dns_servers))
+
+        data = {
+            "domain": domain,
+            "whois": self._get_whois(
+                domain, include_raw=kwargs.get("include_raw", False)),
+            "dns_records": dns_records,
+            "dnssec_enabled": dnssec_enabled,
+            "ip_addresses": ip_addresses,
+            "reverse_dns": reverse_dns,
+        }
+        return self.success_result(domain, search_type, data)
+
+    async def _gather_domain(self, domain: str, record_types,
+                             dns_servers) -> tuple[dict, bool, list[str], dict]:
+        # DNSKEY rides along in the same fan-out: its presence answers
+        # the DNSSEC question without the extra round-trip the old
+        # dedicated probe spent on it.
+        record_types = tuple(record_types)
+        query_types = record_types
+        if "DNSKEY" not in query_types:
+            query_types += ("DNSKEY",)
+        record_tasks = {
+            record_type: asyncio.create_task(
+                self._get_dns_records(domain, record_type, dns_servers))
+            for record_type in query_types}
+        ip_task = asyncio.create_task(self._resolve_ip_addresses(domain))
+        await asyncio.gather(*record_tasks.values(), ip_task,
+                             return_exceptions=True)
+        dns_records = {record_type: task.result()
+                       for record_type, task in record_tasks.items()
+                       if record_type in record_types
+                       and not task.exception() and task.result()}
+        dnskey_task = record_tasks["DNSKEY"]
+        dnssec = (bool(dnskey_task.result())
+                  if not dnskey_task.exception() else False)
+        ips = ip_task.result() if not ip_task.exception() else []
+        # PTRs depend on the resolved addresses, so they form a second
+        # wave -- but the five lookups within it run concurrently rather
+        # than as the old serial per-IP loop.
+        ptrs = await asyncio.gather(
+            *(self._get_reverse_dns_async(ip, dns_servers)
+              for ip in ips[:5]),
+            return_exceptions=True)
+        reverse_dns = {
+            ip: ptr if not isinstance(ptr, BaseException) else None
+            for ip, ptr in zip(ips[:5], ptrs)}
+        return dns_records, dnssec, ips, reverse_dns
+
+    def _get_async_resolver(self, dns_servers=None):
+        import dns.asyncresolver
+        import dns.resolver
+        if dns_servers:
+            # Custom servers get a one-off resolver rather than mutating
+            # the shared one under concurrent tasks.
+            resolver = dns.asyncresolver.Resolver()
+            resolver.timeout = 10
+            resolver.lifetime = 10
+            resolver.nameservers = list(dns_servers)
+            return resolver
+        if self._async_resolver is None:
+            resolver = dns.asyncresolver.Resolver()
+            resolver.cache = dns.resolver.LRUCache(max_size=4096)
+            resolver.timeout = 10
+            resolver.lifetime = 10
+            self._async_resolver = resolver
+        return self._async_resolver
+
+    def _get_resolver(self, dns_servers=None):
+        import dns.resolver
+        if dns_servers:
+            resolver = dns.resolver.Resolver()
+            resolver.timeout = 10
+            resolver.lifetime = 10
+            resolver.nameservers = list(dns_servers)
+            return resolver
+        if self._resolver is None:
+            resolver = dns.resolver.Resolver()
+            resolver.cache = dns.resolver.LRUCache(max_size=4096)
+            resolver.timeout = 10
+            resolver.lifetime = 10
+            self._resolver = resolver
+        return self._resolver
+
+    async def _get_dns_records(self, domain: str, record_type: str,
+                               dns_servers=None) -> list[str]:
+        import dns.resolver
+        key = (domain, record_type, tuple(dns_servers or ()))
+        try:
+            return self._dns_cache[key]
+        except KeyError:
+            pass
+        resolver = self._get_async_resolver(dns_servers)
+        try:
+            answer = await resolver.resolve(domain, record_type)
+        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+            records: list[str] = []
+        else:
+            records = [rdata.to_text() for rdata in answer]
+        # Only successful (possibly empty) answers are cached; timeouts
+        # and server failures propagate so they do not stick for the TTL.
+        self._dns_cache[key] = records
+        return records
+
+    async def _resolve_ip_addresses(self, domain: str) -> list[str]:
+        import dns.exception
+        import dns.resolver
+        resolver = self._get_async_resolver()
+        ips: list[str] = []
+        for record_type in ("A", "AAAA"):
+            try:
+                answer = await resolver.resolve(domain, record_type)
+            except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN,
+                    dns.exception.DNSException):
+                continue
+            ips.extend(rdata.to_text() for rdata in answer)
+        return ips
+
+    async def _get_reverse_dns_async(self, ip: str,
+                                     dns_servers=None) -> str | None:
+        import dns.exception
+        import dns.resolver
+        import dns.reversename
+        key = (ip, tuple(dns_servers or ()))
+        try:
+            return self._dns_cache[key]
+        except KeyError:
+            pass
+        resolver = self._get_async_resolver(dns_servers)
+        try:
+            reverse_name = dns.reversename.from_address(ip)
+            answer = await resolver.resolve(reverse_name, "PTR")
+        except (dns.exception.DNSException, ValueError):
+            return None
+        hostname = str(answer[0]).rstrip(".")
+        self._dns_cache[key] = hostname
+        return hostname
+
+    def _get_reverse_dns(self, ip: str, dns_servers=None) -> str | None:
+        import dns.exception
+        import dns.resolver
+        import dns.reversename
+        key = (ip, tuple(dns_servers or ()))
+        try:
+            return self._dns_cache[key]
+        except KeyError:
+            pass
+        resolver = self._get_resolver(dns_servers)
+        try:
+            reverse_name = dns.reversename.from_address(ip)
+            answer = resolver.resolve(reverse_name, "PTR")
+        except (dns.exception.DNSException, ValueError):
+            return None
+        hostname = str(answer[0]).rstrip(".")
+        self._dns_cache[key] = hostname
+        return hostname
+
+    def _get_whois(self, domain: str, timeout: int = 30,
+                   include_raw: bool = False) -> dict:
+        cached = self._whois_cache.get(domain)
+        if cached is not None and (not include_raw
+                                   or "raw_output" in cached):
+            if not include_raw and "raw_output" in cached:
+                # The cache keeps the full record; don't hand the raw
+                # 5-50 KB blob to callers that didn't ask for it.
+                slim = dict(cached)
+                del slim["raw_output"]
+                return slim
+            return cached
+        if _whois_available():
+            import whois
+            try:
+                record = whois.whois(domain)
+            except Exception as exc:  # noqa: BLE001 - library raises Exception
+                self.log_warning(f"whois lookup failed for {domain}: {exc}")
+                return {}
+            raw_text = record.text or ""
+            data = {
+                "registrar": record.registrar,
+                "creation_date": str(record.creation_date),
+                "expiration_date": str(record.expiration_date),
+                "name_servers": record.name_servers or [],
+                "status": record.status,
+                "raw_output_length": len(raw_text),
+            }
+            if include_raw:
+                data["raw_output"] = raw_text
+        else:
+            # Fallback: talk the whois protocol over port 43 ourselves.
+            try:
+                server = self._server_for(domain, timeout)
+                output = self._whois_query(server, domain, timeout)
+            except OSError as exc:
+                self.log_warning(f"whois query failed for {domain}: {exc}")
+                return {}
+            data = self._parse_whois_output(output, include_raw=include_raw)
+        self._whois_cache[domain] = data
+        return data
+
+    def _search_ip(self, ip: str, search_type: SearchType,
+                   **kwargs) -> PluginResult:
+        # ipaddress handles v4 and v6 uniformly and rejects the sloppy
+        # shorthand inet_aton accepted, so AAAA-only infrastructure works
+        # and obvious non-IPs never cost a PTR round-trip.
+        try:
+            ip_obj = ipaddress.ip_address(ip)
+        except ValueError:
+            return self.error_result(ip, search_type, f"Invalid IP address: {ip}")
+        data = {
+            "ip": str(ip_obj),
+            "version": ip_obj.version,
+            "reverse_dns": (self._get_reverse_dns(str(ip_obj))
+                            if _dns_available() else None),
+            "whois": self._get_whois(
+                str(ip_obj), include_raw=kwargs.get("include_raw", False)),
+        }
+        return self.success_result(ip, search_type, data)
+
+    def _server_for(self, query: str, timeout: int) -> str:
+        """Pick the registry whois server for the query's TLD.
+
+        Known TLDs come from the static table; anything else asks IANA
+        once and follows its ``refer:`` line.
+        """
+        tld = query.rstrip(".").rsplit(".", 1)[-1].lower()
+        server = WHOIS_SERVERS.get(tld)
+        if server:
+            return server
+        referral = self._whois_query(IANA_WHOIS, tld, timeout)
+        for line in referral.splitlines():
+            if line.lower().startswith("refer:"):
+                return line.split(":", 1)[1].strip()
+        return IANA_WHOIS
+
+    def _whois_query(self, server: str, query: str, timeout: int) -> str:
+        """Raw whois protocol exchange: send the query, read until EOF."""
+        chunks = []
+        with socket.create_connection((server, 43), timeout=timeout) as sock:
+            sock.sendall(f"{query}\r\n".encode())
+            while chunk := sock.recv(4096):
+                chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8", "ignore")
+
+    def _parse_whois_output(self, output: str,
+                            include_raw: bool = False) -> dict:
+        data: dict = {
+            "domain_name": None,
+            "registrar": None,
+            "creation_date": None,
+            "expiration_date": None,
+        }
+        # Sets make repeated values O(1) to dedup; registrar dumps can
+        # carry dozens of status and nameserver lines, and the old
+        # list-membership check made the parse quadratic in them.
+        name_servers: set[str] = set()
+        statuses: set[str] = set()
+        # One multiline pass over the original output; the field name picks
+        # the slot via the dispatch table, replacing the per-line chain of
+        # substring scans over a lowercased copy of the whole response.
+        for match in WHOIS_FIELD_RE.finditer(output):
+            field = _WHOIS_FIELDS[match.group(1).lower()]
+            value = match.group(2)
+            if field == "name_servers":
+                name_servers.add(value)
+            elif field == "status":
+                statuses.add(value)
+            else:
+                data[field] = value
+        data["name_servers"] = sorted(name_servers)
+        data["status"] = sorted(statuses)
+        # Raw responses run 5-50 KB and dominate serialized result size,
+        # so they ride along only on request; raw_output_length is always
+        # present so callers can tell whether include_raw is worth it.
+        data["raw_output_length"] = len(output)
+        if include_raw:
+            data["raw_output"] = output
+        return data
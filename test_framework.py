@@ -0,0 +1,100 @@
+"""Framework self-checks: discovery, engine, aggregation, export, settings.
+
+The ``check_*`` functions are plain callables, collected as pytest items
+by ``tests/test_framework_suite.py``; running this file directly shells
+out to pytest. The non-``test_`` names keep pytest from collecting this
+module a second time.
+"""
+
+import io
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from core.exporter import Exporter
+from core.plugin_base import BasePlugin, PluginResult, SearchType
+from core.result_handler import ResultAggregator
+
+
+def check_plugin_discovery(discovered_plugins):
+    assert discovered_plugins, "no plugins discovered"
+    names = [plugin.name for plugin in discovered_plugins]
+    assert len(names) == len(set(names)), "duplicate plugin names"
+    assert all(isinstance(plugin, BasePlugin)
+               for plugin in discovered_plugins)
+
+
+def check_engine_initialization(engine):
+    assert engine.get_all_plugins(), "engine has no plugins registered"
+    assert len(engine.get_enabled_plugins()) <= len(engine.get_all_plugins())
+    assert engine.get_results() == []
+
+
+def check_result_aggregation():
+    aggregator = ResultAggregator()
+    aggregator.start_search(2)
+    aggregator.add_result(PluginResult(
+        plugin_name="a", query="q", search_type=SearchType.DOMAIN,
+        success=True, data={"hits": 1}, execution_time=0.5))
+    aggregator.add_result(PluginResult(
+        plugin_name="b", query="q", search_type=SearchType.DOMAIN,
+        success=False, error_message="boom", execution_time=0.25))
+    aggregator.end_search()
+
+    summary = aggregator.get_summary()
+    assert summary["total_results"] == 2
+    assert summary["successful"] == 1
+    assert summary["failed"] == 1
+    assert summary["searches_run"] == 1
+    assert abs(summary["total_execution_time"] - 0.75) < 1e-9
+
+
+def check_export_system():
+    results = [PluginResult(
+        plugin_name="a", query="example.com", search_type=SearchType.DOMAIN,
+        success=True, data={"hits": 1})]
+    # In-memory sinks: the test covers serialization, not the filesystem.
+    # The four formats are independent, so serialize them concurrently;
+    # the sqlite connection is opened inside its task because sqlite3
+    # connections are bound to their creating thread.
+    def _text_export(export):
+        sink = io.StringIO()
+        export(results, query="test", sink=sink)
+        return sink.getvalue()
+
+    def _sqlite_export(exporter):
+        with sqlite3.connect(":memory:") as connection:
+            exporter.export_sqlite(results, connection=connection)
+            return connection.execute(
+                "SELECT COUNT(*) FROM results").fetchone()[0]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        exporter = Exporter(output_dir=tmpdir)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {export.__name__: executor.submit(_text_export, export)
+                       for export in (exporter.export_json,
+                                      exporter.export_html,
+                                      exporter.export_csv)}
+            sqlite_future = executor.submit(_sqlite_export, exporter)
+            for name, future in futures.items():
+                assert future.result(), f"empty export from {name}"
+            assert sqlite_future.result() == 1
+
+
+def check_configuration():
+    from config import settings
+
+    assert settings.get_setting("search", "timeout") is not None
+    assert settings.get_setting("export", "output_dir") is not None
+    assert settings.get_setting("search", "no_such_key", default=7) == 7
+
+
+def main() -> int:
+    """Thin shim: the real runner is pytest, which parallelizes the checks."""
+    import pytest
+
+    return pytest.main(["tests/test_framework_suite.py"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Smoke-run every plugin against a benign query and print a summary.
+
+Not a pytest module: run it directly with ``python test_plugins.py``.
+It exercises each plugin's full search path, network included.
+"""
+
+import asyncio
+
+from core.engine import OSINTEngine
+from core.plugin_base import SearchType
+from plugins import discover_plugins
+
+TEST_CASES = [
+    ("hibp", "password123", SearchType.PASSWORD),
+    ("phone", "+14155552671", SearchType.PHONE),
+    ("photon", "https://example.com", SearchType.URL),
+    ("sherlock", "octocat", SearchType.USERNAME),
+    ("shodan", "8.8.8.8", SearchType.IP),
+    ("spider", "https://example.com", SearchType.URL),
+    ("theharvester", "example.com", SearchType.DOMAIN),
+    ("whois", "example.com", SearchType.DOMAIN),
+]
+
+
+async def _run_all(engine: OSINTEngine) -> list:
+    # Each case is an independent network wait, so overlap them; the
+    # semaphore keeps us polite if several cases hit the same host.
+    semaphore = asyncio.Semaphore(8)
+
+    async def _run(plugin_name, query, search_type):
+        async with semaphore:
+            return await asyncio.to_thread(engine.run_single_plugin,
+                                           plugin_name, query, search_type)
+
+    return await asyncio.gather(*(_run(*case) for case in TEST_CASES))
+
+
+def main() -> int:
+    engine = OSINTEngine()
+    for plugin in discover_plugins():
+        engine.register_plugin(plugin)
+
+    # gather preserves argument order, so the summary below still
+    # prints in TEST_CASES order.
+    results = asyncio.run(_run_all(engine))
+
+    failed = 0
+    for (plugin_name, _, _), result in zip(TEST_CASES, results):
+        if result is None:
+            print(f"{plugin_name:14s} SKIPPED (not registered or disabled)")
+            continue
+        status = "ok" if result.success else f"FAILED: {result.error_message}"
+        print(f"{plugin_name:14s} {result.execution_time:6.2f}s  {status}")
+        failed += not result.success
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
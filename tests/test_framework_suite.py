@@ -0,0 +1,33 @@
+"""Runs the framework self-checks as parametrized pytest items.
+
+Each check becomes its own item so ``pytest -n auto`` can spread them
+across workers; fixture-taking checks get their arguments resolved from
+the session fixtures in conftest.py.
+"""
+
+import inspect
+
+import pytest
+
+from test_framework import (
+    check_configuration,
+    check_engine_initialization,
+    check_export_system,
+    check_plugin_discovery,
+    check_result_aggregation,
+)
+
+CHECKS = [
+    check_plugin_discovery,
+    check_engine_initialization,
+    check_result_aggregation,
+    check_export_system,
+    check_configuration,
+]
+
+
+@pytest.mark.parametrize("check", CHECKS, ids=[fn.__name__ for fn in CHECKS])
+def test_framework_check(check, request):
+    arguments = [request.getfixturevalue(name)
+                 for name in inspect.signature(check).parameters]
+    check(*arguments)
@@ -0,0 +1,27 @@
+"""Tests for the Have I Been Pwned plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.hibp_plugin import HIBPPlugin
+
+
+@pytest.fixture(scope="module")
+def hibp():
+    """One plugin instance per module; constructors are not free."""
+    return HIBPPlugin()
+
+
+def test_hibp_plugin_search_without_api_key(hibp):
+    # Fails before any request is issued; no cassette involved.
+    result = hibp.search("user@example.com", SearchType.EMAIL)
+    assert not result.success
+    assert "api key" in result.error_message.lower()
+
+
+@pytest.mark.integration
+def test_hibp_plugin_check_password(hibp):
+    # "password123" is in every breach corpus; a random UUID-ish string
+    # should not be.
+    assert hibp.check_password("password123") > 0
+    assert hibp.check_password("6c2d1a0e-b1f9-4e52-a35d-8f1f2f3a4b5c") == 0
@@ -0,0 +1,37 @@
+"""Tests for the Photon crawler plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.photon_plugin import PhotonPlugin
+
+
+@pytest.fixture(scope="module")
+def photon():
+    """One plugin instance per module; constructors are not free."""
+    return PhotonPlugin()
+
+
+def test_photon_plugin_normalize_url(photon):
+    assert photon._normalize_url("example.com") == "https://example.com"
+    assert photon._normalize_url("http://example.com") == "http://example.com"
+
+
+def test_photon_plugin_extract_emails(photon):
+    emails: set[str] = set()
+    photon._extract_emails("contact a@example.com or b@example.org", emails)
+    assert emails == {"a@example.com", "b@example.org"}
+
+
+@pytest.mark.integration
+def test_photon_plugin_search_integration(photon):
+    result = photon.search("https://example.com", SearchType.URL, max_pages=2)
+    assert result.success
+    assert result.data["pages_crawled"] >= 1
+
+
+@pytest.mark.vcr()
+def test_photon_plugin_search_with_invalid_url(photon):
+    result = photon.search("http://localhost:1", SearchType.URL,
+                           max_pages=1, timeout=2)
+    assert not result.success
@@ -0,0 +1,39 @@
+"""One parametrized contract test instead of init/search-type pairs per file."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.hibp_plugin import HIBPPlugin
+from plugins.photon_plugin import PhotonPlugin
+from plugins.sherlock_plugin import SherlockPlugin
+from plugins.shodan_plugin import ShodanPlugin
+from plugins.spider_plugin import SpiderPlugin
+from plugins.theharvester_plugin import TheHarvesterPlugin
+from plugins.whois_plugin import WhoisPlugin
+
+CONTRACTS = [
+    (HIBPPlugin, "hibp",
+     {SearchType.EMAIL, SearchType.PASSWORD}, {"pwned", "breach"}),
+    (PhotonPlugin, "photon",
+     {SearchType.URL, SearchType.DOMAIN}, {"crawler"}),
+    (SherlockPlugin, "sherlock",
+     {SearchType.USERNAME}, {"username"}),
+    (ShodanPlugin, "shodan",
+     {SearchType.IP, SearchType.DOMAIN, SearchType.NETWORK}, {"shodan"}),
+    (SpiderPlugin, "spider",
+     {SearchType.URL, SearchType.DOMAIN}, {"crawl"}),
+    (TheHarvesterPlugin, "theharvester",
+     {SearchType.DOMAIN, SearchType.EMAIL}, {"harvest"}),
+    (WhoisPlugin, "whois",
+     {SearchType.DOMAIN, SearchType.IP}, {"whois"}),
+]
+
+
+@pytest.mark.parametrize(("cls", "name", "types", "keywords"), CONTRACTS,
+                         ids=[name for _, name, _, _ in CONTRACTS])
+def test_plugin_contract(cls, name, types, keywords):
+    plugin = cls()
+    assert plugin.name == name
+    assert plugin.enabled
+    assert types <= set(plugin.search_types)
+    assert any(keyword in plugin.description.lower() for keyword in keywords)
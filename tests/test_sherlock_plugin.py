@@ -0,0 +1,28 @@
+"""Tests for the Sherlock username plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.sherlock_plugin import SherlockPlugin
+
+
+@pytest.fixture(scope="module")
+def sherlock():
+    """One plugin instance per module; constructors are not free."""
+    return SherlockPlugin()
+
+
+def test_sherlock_plugin_install_probe_is_cached():
+    # Fresh instances on purpose: the probe runs at construction, so the
+    # shared module fixture would carry a stale class-level answer.
+    SherlockPlugin._installed = None
+    first = SherlockPlugin()._sherlock_available
+    assert SherlockPlugin._installed is first
+    assert SherlockPlugin()._sherlock_available is first
+
+
+@pytest.mark.integration
+def test_sherlock_plugin_search_integration(sherlock):
+    result = sherlock.search("octocat", SearchType.USERNAME, timeout=15)
+    assert result.success
+    assert result.data["sites_found"] >= 1
@@ -0,0 +1,30 @@
+"""Tests for the Shodan plugin."""
+
+import os
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.shodan_plugin import ShodanPlugin
+
+
+@pytest.fixture(scope="module")
+def shodan():
+    """One plugin instance per module; constructors are not free."""
+    return ShodanPlugin()
+
+
+def test_shodan_plugin_search_without_api_key(shodan):
+    result = shodan.search("8.8.8.8", SearchType.IP)
+    assert not result.success
+    assert "api key" in result.error_message.lower()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif("SHODAN_API_KEY" not in os.environ,
+                    reason="SHODAN_API_KEY not set")
+def test_shodan_plugin_search_with_api_key(shodan):
+    result = shodan.search("8.8.8.8", SearchType.IP,
+                           api_key=os.environ["SHODAN_API_KEY"])
+    assert result.success
+    assert result.data["ip"] == "8.8.8.8"
@@ -0,0 +1,27 @@
+"""Tests for the Spider crawler plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.spider_plugin import SpiderPlugin
+
+
+@pytest.fixture(scope="module")
+def spider():
+    """One plugin instance per module; constructors are not free."""
+    return SpiderPlugin()
+
+
+def test_spider_plugin_header_technology_detection(spider):
+    detected = spider._detect_header_technologies(
+        {"Server": "nginx/1.25", "X-Powered-By": "PHP/8.2"})
+    assert "nginx" in detected
+    assert "PHP" in detected
+
+
+@pytest.mark.integration
+def test_spider_plugin_search_integration(spider):
+    result = spider.search("https://example.com", SearchType.URL,
+                           max_depth=1, max_pages=3)
+    assert result.success
+    assert result.data["pages_crawled"] >= 1
@@ -0,0 +1,34 @@
+"""Tests for the theHarvester plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.theharvester_plugin import TheHarvesterPlugin, _pattern_for
+
+
+@pytest.fixture(scope="module")
+def harvester():
+    """One plugin instance per module; constructors are not free."""
+    return TheHarvesterPlugin()
+
+
+def test_theharvester_plugin_normalize_domain(harvester):
+    assert harvester._normalize_domain("Example.COM") == "example.com"
+    assert harvester._normalize_domain("user@example.com") == "example.com"
+    assert harvester._normalize_domain("https://example.com/x") == "example.com"
+
+
+def test_theharvester_plugin_parse_body(harvester):
+    body = "mail a@example.com and https://dev.example.com/path"
+    parsed = harvester._parse_body(body, "example.com",
+                                   _pattern_for("example.com"))
+    assert "a@example.com" in parsed["emails"]
+    assert "dev.example.com" in parsed["subdomains"]
+
+
+@pytest.mark.integration
+def test_theharvester_plugin_search_integration(harvester):
+    result = harvester.search("example.com", SearchType.DOMAIN,
+                              sources=["duckduckgo"], timeout=15)
+    assert result.success
+    assert result.data["domain"] == "example.com"
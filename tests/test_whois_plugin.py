@@ -0,0 +1,43 @@
+"""Tests for the whois/DNS plugin."""
+
+import pytest
+
+from core.plugin_base import SearchType
+from plugins.whois_plugin import WhoisPlugin
+
+
+@pytest.fixture(scope="module")
+def whois():
+    """One plugin instance per module; constructors are not free."""
+    return WhoisPlugin()
+
+
+def test_whois_plugin_rejects_invalid_ip(whois):
+    result = whois.search("not-an-ip", SearchType.IP)
+    assert not result.success
+    assert "invalid ip" in result.error_message.lower()
+
+
+def test_whois_plugin_parse_whois_output(whois):
+    output = (
+        "Domain Name: EXAMPLE.COM\n"
+        "   Registrar: Example Registrar\n"
+        "   Creation Date: 1995-08-14T04:00:00Z\n"
+        "   Name Server: A.IANA-SERVERS.NET\n"
+        "   Name Server: B.IANA-SERVERS.NET\n"
+        "   Name Server: A.IANA-SERVERS.NET\n"
+        "   Domain Status: clientTransferProhibited\n")
+    data = whois._parse_whois_output(output)
+    assert data["domain_name"] == "EXAMPLE.COM"
+    assert data["registrar"] == "Example Registrar"
+    assert data["name_servers"] == ["A.IANA-SERVERS.NET",
+                                    "B.IANA-SERVERS.NET"]
+    assert data["status"] == ["clientTransferProhibited"]
+    assert "raw_output" not in data
+
+
+@pytest.mark.integration
+def test_whois_plugin_search_integration(whois):
+    result = whois.search("example.com", SearchType.DOMAIN)
+    assert result.success
+    assert result.data["dns_records"]
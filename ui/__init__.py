@@ -0,0 +1 @@
+"""Console user interface: rich-backed rendering and interactive menus."""
@@ -0,0 +1,195 @@
+"""Rich-backed console rendering for plugins and search results.
+
+Rich's import tree is heavy and ``Console()`` probes the terminal, so
+submodules load lazily (PEP 562) and the console is built on first use.
+Callers that only need ``print_success``/``print_error``/``print_info``
+never pay for tables, trees or panels.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections import deque
+from functools import cache
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from core.plugin_base import BasePlugin, PluginResult
+
+if TYPE_CHECKING:
+    from rich.text import Text
+    from rich.tree import Tree
+
+_LAZY = {
+    "Console": "rich.console",
+    "Panel": "rich.panel",
+    "Table": "rich.table",
+    "Text": "rich.text",
+    "Tree": "rich.tree",
+}
+
+
+def __getattr__(name: str):
+    if name == "box":
+        # box is a module, not an attribute of the rich package.
+        return importlib.import_module("rich.box")
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@cache
+def _get_console():
+    from rich.console import Console
+
+    return Console()
+
+
+def print_success(message: str) -> None:
+    _get_console().print(f"[green]✓[/green] {message}")
+
+
+def print_error(message: str) -> None:
+    _get_console().print(f"[red]✗[/red] {message}")
+
+
+def print_info(message: str) -> None:
+    _get_console().print(f"[cyan]ℹ[/cyan] {message}")
+
+
+def display_plugins(plugins: list[BasePlugin]) -> None:
+    """Render the plugin registry as a table."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title="Available plugins", box=box.ROUNDED)
+    table.add_column("Name", style="bold")
+    table.add_column("Description")
+    table.add_column("Search types")
+    table.add_column("Enabled", justify="center")
+    for plugin in plugins:
+        types = ", ".join(t.value for t in plugin.search_types)
+        enabled = "[green]yes[/green]" if plugin.enabled else "[red]no[/red]"
+        table.add_row(plugin.name, plugin.description, types, enabled)
+    _get_console().print(table)
+
+
+def new_results_table():
+    """An empty summary table; rows are appended via add_result_row."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title="Search results", box=box.ROUNDED)
+    table.add_column("Plugin", style="bold")
+    table.add_column("Query")
+    table.add_column("Status", justify="center")
+    table.add_column("Time", justify="right")
+    return table
+
+
+def add_result_row(table, result: PluginResult) -> None:
+    status = "[green]ok[/green]" if result.success else "[red]failed[/red]"
+    table.add_row(result.plugin_name, result.query, status,
+                  f"{result.execution_time:.2f}s")
+
+
+def display_results_summary(results: list[PluginResult]) -> None:
+    """One table row per result: status, timing and finding count."""
+    table = new_results_table()
+    for result in results:
+        add_result_row(table, result)
+    _get_console().print(table)
+
+
+def display_results_detailed(results: list[PluginResult],
+                             max_depth: int = 4) -> None:
+    """Render each result as a panel with its data as a tree."""
+    for result in results:
+        if result.success:
+            _display_success_result(result, max_depth)
+        else:
+            _display_failed_result(result)
+
+
+@cache
+def _panel_labels() -> dict[str, Text]:
+    """Panel field labels, styled once; ``Text.assemble`` below then skips
+    Rich's markup parser entirely on the per-result path."""
+    from rich.text import Text
+
+    return {
+        "query": Text("Query: ", style="bold"),
+        "type": Text("Search type: ", style="bold"),
+        "time": Text("Time: ", style="bold"),
+        "timestamp": Text("Timestamp: ", style="bold"),
+        "error": Text("Error: ", style="bold"),
+    }
+
+
+def _display_success_result(result: PluginResult, max_depth: int) -> None:
+    from rich import box
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.tree import Tree
+
+    labels = _panel_labels()
+    header = Text.assemble(
+        labels["query"], result.query, "\n",
+        labels["type"], result.search_type.value, "\n",
+        labels["time"], f"{result.execution_time:.2f}s", "\n",
+        labels["timestamp"], str(result.timestamp))
+    title = Text(result.plugin_name, style="green")
+    _get_console().print(Panel(header, title=title, box=box.ROUNDED))
+    tree = Tree(Text("data", style="bold"))
+    _build_tree(tree, result.data, 0, max_depth)
+    _get_console().print(tree)
+
+
+def _display_failed_result(result: PluginResult) -> None:
+    from rich import box
+    from rich.panel import Panel
+    from rich.text import Text
+
+    labels = _panel_labels()
+    body = Text.assemble(
+        labels["query"], result.query, "\n",
+        labels["error"], result.error_message or "")
+    title = Text(result.plugin_name, style="red")
+    _get_console().print(Panel(body, title=title, box=box.ROUNDED))
+
+
+def _build_tree(node: Tree, data, current_depth: int, max_depth: int) -> None:
+    """Attach nested dicts/lists to a rich tree.
+
+    Iterative with an explicit work stack: deep Sherlock/Shodan payloads
+    would otherwise pay a Python frame per nested container. Children are
+    pushed in reverse so pops preserve source order.
+    """
+    stack = deque([(node, data, current_depth)])
+    while stack:
+        node, data, depth = stack.pop()
+        if depth >= max_depth:
+            node.add("[yellow]...[/yellow]")
+            continue
+        if isinstance(data, dict):
+            pending = []
+            for key, value in data.items():
+                if isinstance(value, (dict, list)):
+                    branch = node.add(f"[cyan]{key}[/cyan]")
+                    pending.append((branch, value, depth + 1))
+                else:
+                    node.add(f"[cyan]{key}:[/cyan] {value}")
+            stack.extend(reversed(pending))
+        elif isinstance(data, list):
+            pending = []
+            for item in islice(data, 10):
+                if isinstance(item, (dict, list)):
+                    branch = node.add("[cyan]-[/cyan]")
+                    pending.append((branch, item, depth + 1))
+                else:
+                    node.add(str(item))
+            if len(data) > 10:
+                node.add(f"[dim]... {len(data) - 10} more[/dim]")
+            stack.extend(reversed(pending))
+        else:
+            node.add(str(data))
@@ -0,0 +1,277 @@
+"""Interactive menu loop tying plugins, engine, export and settings together."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+try:
+    import questionary
+    QUESTIONARY_AVAILABLE = True
+except ImportError:
+    QUESTIONARY_AVAILABLE = False
+
+from config import settings
+from core.engine import OSINTEngine
+from core.plugin_base import SearchType
+from plugins import discover_plugins
+
+if TYPE_CHECKING:
+    from core.exporter import Exporter
+
+from ui.display import (
+    _get_console,
+    add_result_row,
+    display_plugins,
+    display_results_detailed,
+    display_results_summary,
+    new_results_table,
+    print_error,
+    print_info,
+    print_success,
+)
+
+# Enum iteration is static per process; built once instead of per tick.
+_ALL_SEARCH_TYPES = tuple(SearchType)
+
+
+def _select(message: str, choices):
+    """One selection prompt for every menu; None when the user cancels.
+
+    questionary renders through prompt_toolkit's screen diff, so only
+    changed cells are redrawn per keystroke.
+    """
+    return questionary.select(message, choices=list(choices)).ask()
+
+
+def _text(message: str) -> str | None:
+    answer = questionary.text(message).ask()
+    return answer.strip() if answer else None
+
+
+def _choice(title: str, value):
+    return questionary.Choice(title=title, value=value)
+
+
+# Static choice lists are built once at import time; every menu tick
+# reuses them instead of reallocating identical lists and choices.
+if QUESTIONARY_AVAILABLE:
+    _MAIN_MENU_CHOICES = (
+        _choice("Search with all plugins", "search"),
+        _choice("Search with a single plugin", "single"),
+        _choice("List available plugins", "plugins"),
+        _choice("Toggle a plugin on/off", "toggle"),
+        _choice("Settings", "config"),
+        _choice("Export last results", "export"),
+        _choice("Quit", "quit"),
+    )
+    _CONFIG_MENU_CHOICES = (
+        _choice("Show current settings", "show"),
+        _choice("Change a value", "edit"),
+        _choice("Back", "back"),
+    )
+    _EXPORT_MENU_CHOICES = (
+        _choice("JSON", "json"), _choice("HTML", "html"),
+        _choice("CSV", "csv"), _choice("SQLite", "sqlite"),
+        _choice("All formats", "all"), _choice("Back", "back"),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_search_type_choices(types: tuple[SearchType, ...]) -> tuple:
+    """Choices for a search-type prompt; cached per supported set."""
+    return tuple(_choice(t.value, t) for t in types)
+
+
+class MenuSystem:
+    """Drives the interactive session: prompt, dispatch, display, repeat."""
+
+    def __init__(self):
+        self.engine = OSINTEngine()
+        for plugin in discover_plugins():
+            self.engine.register_plugin(plugin)
+        # The exporter (and its csv/sqlite imports) loads on first export,
+        # not at time-to-first-prompt.
+        self._exporter: Exporter | None = None
+        self.last_results = []
+        self.last_query = ""
+        # Plugin lists and their prompt choices change only on toggle, so
+        # they are cached per menu session rather than rebuilt each tick.
+        self._plugin_cache: dict[str, list] = {}
+
+    def run(self) -> None:
+        if not QUESTIONARY_AVAILABLE:
+            print_error("The interactive menu requires the questionary "
+                        "package (pip install questionary)")
+            return
+        print_info("OSINT toolkit — Ctrl+C to leave any prompt")
+        while True:
+            try:
+                action = _select("What would you like to do?",
+                                 _MAIN_MENU_CHOICES)
+            except KeyboardInterrupt:
+                break
+            if action in (None, "quit"):
+                break
+            try:
+                getattr(self, f"_action_{action}")()
+            except KeyboardInterrupt:
+                continue
+        print_info("Bye")
+
+    def _select_search_type(self, supported=None) -> SearchType | None:
+        types = tuple(supported) if supported else _ALL_SEARCH_TYPES
+        return _select("Search type", _build_search_type_choices(types))
+
+    def _ask_query(self) -> str | None:
+        return _text("Query")
+
+    def _action_search(self) -> None:
+        search_type = self._select_search_type()
+        if search_type is None:
+            return
+        query = self._ask_query()
+        if query is None:
+            return
+        from rich.live import Live
+
+        # Stream: each result is rendered the moment its plugin finishes,
+        # instead of buffering the whole sweep behind the slowest plugin.
+        max_depth = settings.get_setting("display", "max_depth", default=4)
+        table = new_results_table()
+        results = []
+        with Live(table, console=_get_console()) as live:
+            for result in self.engine.iter_run_all_plugins(query,
+                                                           search_type):
+                results.append(result)
+                display_results_detailed([result], max_depth=max_depth)
+                add_result_row(table, result)
+                live.refresh()
+        if not results:
+            print_error("No results")
+            return
+        self.last_results = results
+        self.last_query = query
+
+    def _get_all_plugins_cached(self) -> list:
+        if "all" not in self._plugin_cache:
+            self._plugin_cache["all"] = self.engine.get_all_plugins()
+        return self._plugin_cache["all"]
+
+    def _get_plugin_choices_cached(self) -> list:
+        if "choices" not in self._plugin_cache:
+            self._plugin_cache["choices"] = [
+                _choice(p.display_label, p)
+                for p in self._get_all_plugins_cached()]
+        return self._plugin_cache["choices"]
+
+    def _action_single(self) -> None:
+        choices = self._get_plugin_choices_cached()
+        if not choices:
+            print_error("No plugins registered")
+            return
+        plugin = _select("Plugin", choices)
+        if plugin is None:
+            return
+        search_type = self._select_search_type(plugin.search_types)
+        if search_type is None:
+            return
+        query = self._ask_query()
+        if query is None:
+            return
+        self._execute_single_search(plugin.name, query, search_type)
+
+    def _execute_single_search(self, plugin_name: str, query: str,
+                               search_type: SearchType) -> None:
+        import asyncio
+
+        # The plugin runs on a worker thread under a private event loop,
+        # so the status spinner keeps animating while it waits on I/O;
+        # the engine aggregates the result itself.
+        with _get_console().status(f"Searching for {query}..."):
+            result = asyncio.run(asyncio.to_thread(
+                self.engine.run_single_plugin, plugin_name, query,
+                search_type))
+        if result is None:
+            print_error(f"Plugin {plugin_name} is unknown or disabled")
+            return
+        self._show_results([result], query)
+
+    def _show_results(self, results: list, query: str) -> None:
+        if not results:
+            print_error("No results")
+            return
+        self.last_results = results
+        self.last_query = query
+        display_results_summary(results)
+        display_results_detailed(
+            results,
+            max_depth=settings.get_setting("display", "max_depth", default=4))
+
+    def _action_plugins(self) -> None:
+        display_plugins(self._get_all_plugins_cached())
+
+    def _action_toggle(self) -> None:
+        choices = self._get_plugin_choices_cached()
+        if not choices:
+            print_error("No plugins registered")
+            return
+        plugin = _select("Plugin to toggle", choices)
+        if plugin is None:
+            return
+        if plugin.enabled:
+            plugin.disable()
+            print_info(f"{plugin.name} disabled")
+        else:
+            plugin.enable()
+            print_success(f"{plugin.name} enabled")
+        # Enabled/disabled state feeds the cached choice labels.
+        self._plugin_cache.clear()
+
+    def _action_config(self) -> None:
+        while True:
+            action = _select("Settings", _CONFIG_MENU_CHOICES) or "back"
+            if action == "back":
+                return
+            if action == "show":
+                for section, values in settings._load_settings().items():
+                    print_info(f"{section}: {values}")
+            elif action == "edit":
+                section = _text("Section")
+                key = _text("Key")
+                value = _text("Value")
+                if not (section and key and value):
+                    continue
+                if value.isdigit():
+                    value = int(value)
+                try:
+                    settings.set_setting(section, key, value)
+                except RuntimeError as exc:
+                    print_error(str(exc))
+                else:
+                    print_success("Saved")
+
+    def _get_exporter(self) -> Exporter:
+        if self._exporter is None:
+            from core.exporter import Exporter
+
+            self._exporter = Exporter(
+                output_dir=settings.get_setting("export", "output_dir",
+                                                default="exports"))
+        return self._exporter
+
+    def _action_export(self) -> None:
+        if not self.last_results:
+            print_error("Nothing to export yet — run a search first")
+            return
+        fmt = _select("Export format", _EXPORT_MENU_CHOICES) or "back"
+        if fmt == "back":
+            return
+        exporter = self._get_exporter()
+        if fmt == "all":
+            paths = exporter.export_all(self.last_results, self.last_query)
+            for name, path in paths.items():
+                print_success(f"{name}: {path}")
+            return
+        export = getattr(exporter, f"export_{fmt}")
+        print_success(export(self.last_results, self.last_query))
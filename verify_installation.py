@@ -0,0 +1,170 @@
+"""Verify that the toolkit is installed correctly: deps, files, plugins.
+
+Stdlib-only on purpose — this script must run before requirements are
+installed. Run it with ``python verify_installation.py``.
+"""
+
+import importlib.util
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+
+REQUIRED_MODULES = ["requests", "rich", "yaml"]
+OPTIONAL_MODULES = ["aiohttp", "bs4", "cachetools", "dns", "lxml",
+                    "orjson", "questionary", "selectolax", "whois"]
+PROJECT_FILES = [
+    "main.py",
+    "config/settings.py",
+    "core/engine.py",
+    "core/exporter.py",
+    "core/plugin_base.py",
+    "core/result_handler.py",
+    "plugins/__init__.py",
+    "ui/display.py",
+    "ui/menu.py",
+]
+
+# Each check returns (passed, report_lines) instead of printing, so the
+# checks can run on worker threads without fighting over sys.stdout and
+# the report still comes out in a fixed order.
+CheckResult = tuple[bool, list[str]]
+
+
+def check_python_version() -> CheckResult:
+    ok = sys.version_info >= (3, 10)
+    mark = "ok" if ok else "FAIL (3.10+ required)"
+    return ok, [f"  Python {sys.version_info.major}."
+                f"{sys.version_info.minor}: {mark}"]
+
+
+@lru_cache(maxsize=None)
+def _module_available(module: str) -> bool:
+    """Whether ``module`` resolves, without executing its top-level code.
+
+    find_spec only walks the path finders, so heavy modules (rich's
+    console probe, network clients) are never initialized just to prove
+    they exist; caching also dedupes modules listed in several checks.
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def check_imports() -> CheckResult:
+    ok = True
+    lines = []
+    for module in REQUIRED_MODULES:
+        if _module_available(module):
+            lines.append(f"  {module}: ok")
+        else:
+            lines.append(f"  {module}: MISSING (required)")
+            ok = False
+    return ok, lines
+
+
+def check_optional_imports() -> CheckResult:
+    return True, [
+        f"  {module}: "
+        + ("ok" if _module_available(module) else "missing (optional)")
+        for module in OPTIONAL_MODULES]
+
+
+def _scan(root: str) -> set[str]:
+    """Names of regular files under ``root`` from one readdir pass."""
+    try:
+        with os.scandir(root) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def check_project_files() -> CheckResult:
+    # One scandir per parent directory instead of one stat per file:
+    # DirEntry reuses the readdir file type, so this is ~1 syscall per
+    # directory rather than per path.
+    ok = True
+    lines = []
+    ordered = sorted(PROJECT_FILES, key=os.path.dirname)
+    scanned = {parent: _scan(parent or ".")
+               for parent, _ in groupby(ordered, key=os.path.dirname)}
+    for name in PROJECT_FILES:
+        if os.path.basename(name) in scanned[os.path.dirname(name)]:
+            lines.append(f"  {name}: ok")
+        else:
+            lines.append(f"  {name}: MISSING")
+            ok = False
+    return ok, lines
+
+
+def check_plugins() -> CheckResult:
+    try:
+        from plugins import discover_plugins
+        plugins = discover_plugins()
+    except Exception as exc:  # noqa: BLE001 - report whatever broke discovery
+        return False, [f"  plugin discovery failed: {exc}"]
+    return bool(plugins), [
+        f"  {len(plugins)} plugin(s) discovered: "
+        + ", ".join(sorted(p.name for p in plugins))]
+
+
+def check_exports_dir() -> CheckResult:
+    probe = os.path.join("exports", ".write_probe")
+    try:
+        os.makedirs("exports", exist_ok=True)
+        with open(probe, "w", encoding="utf-8"):
+            pass
+        os.remove(probe)
+    except OSError as exc:
+        return False, [f"  exports/ not writable: {exc}"]
+    return True, ["  exports/: writable"]
+
+
+def check_sherlock_cli() -> CheckResult:
+    if shutil.which("sherlock"):
+        return True, ["  sherlock CLI: ok"]
+    return True, ["  sherlock CLI: missing (optional, used by the sherlock "
+                  "plugin)"]
+
+
+def main() -> int:
+    # check_imports runs first and alone so a missing required dependency
+    # is the first thing in the report.
+    print("Required modules:")
+    ok, lines = check_imports()
+    print("\n".join(lines))
+    failed = not ok
+
+    checks = [
+        ("Python version", check_python_version),
+        ("Optional modules", check_optional_imports),
+        ("Project files", check_project_files),
+        ("Plugins", check_plugins),
+        ("Exports directory", check_exports_dir),
+        ("External tools", check_sherlock_cli),
+    ]
+
+    # The remaining checks are independent and I/O-bound (stat calls,
+    # imports, which() probes), so overlap them; each returns its report
+    # lines and only the main thread prints, in the listed order.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(name, executor.submit(check_func))
+                   for name, check_func in checks]
+        for name, future in futures:
+            ok, lines = future.result()
+            print(f"{name}:")
+            print("\n".join(lines))
+            failed += not ok
+
+    if failed:
+        print(f"\n{failed} check(s) failed")
+        return 1
+    print("\nAll checks passed")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())